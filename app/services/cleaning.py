@@ -1,5 +1,15 @@
 import csv
+import itertools
+import operator
 import os
+from collections import Counter
+from app.services.file_ops import _IO_BUFFER_SIZE
+
+# Number of rows parsed before their columns are counted in analyze_missing_data
+_ROWS_PER_CHUNK = 10000
+
+# Lower-cased cell values that mark a missing measurement ('.' is used by the raw penguins data)
+_MISSING_TOKENS = frozenset({'na', 'n/a', 'nan', 'null', '.', ''})
 
 def analyze_missing_data(input_file='penguins.csv', data_dir='./data'):
     """Reports missing values in CSV"""
@@ -9,18 +19,29 @@ def analyze_missing_data(input_file='penguins.csv', data_dir='./data'):
         return
 
     try:
-        with open(input_path, 'r', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            fieldnames = reader.fieldnames or []
-            missing_counts = {field: 0 for field in fieldnames}
+        with open(input_path, 'r', encoding='utf-8', newline='', buffering=_IO_BUFFER_SIZE) as infile:
+            # Blank lines come through as empty lists and are skipped, as csv.DictReader does
+            reader = filter(None, csv.reader(infile))
+            fieldnames = next(reader, [])
+            value_counts = {field: Counter() for field in fieldnames}
             total_rows = 0
 
-            for row in reader:
-                total_rows += 1
-                for field in fieldnames:
-                    value = row.get(field, '').strip()
-                    if not value or value.lower() in ['na', 'n/a', 'nan', 'null', '']:
-                        missing_counts[field] += 1
+            # Count every distinct value per column, a chunk of rows at a time.
+            # Transposing and counting both run in C; Python only inspects distinct values below.
+            for chunk in iter(lambda: list(itertools.islice(reader, _ROWS_PER_CHUNK)), []):
+                total_rows += len(chunk)
+                for field, values in zip(fieldnames, itertools.zip_longest(*chunk, fillvalue='')):
+                    value_counts[field].update(values)
+
+        missing_counts = {}
+        for field, counts in value_counts.items():
+            # Rows too short to reach this column count as missing too
+            missing = total_rows - sum(counts.values())
+            for value, count in counts.items():
+                value = value.strip()
+                if not value or value.lower() in _MISSING_TOKENS:
+                    missing += count
+            missing_counts[field] = missing
 
         print("\nMissing Data Analysis:")
         for field, count in missing_counts.items():
@@ -32,6 +53,39 @@ def analyze_missing_data(input_file='penguins.csv', data_dir='./data'):
         print(f"Error analyzing data: {e}")
 
 
+def _clean_rows(reader, positions):
+    """Yields cleaned rows from a csv reader, skipping rows with missing data"""
+    # A column absent from the header means no row can be complete
+    if any(pos is None for pos, _ in positions):
+        return
+
+    width = max(pos for pos, _ in positions) + 1
+    pick = operator.itemgetter(*(pos for pos, _ in positions))
+    clean_names = [clean for _, clean in positions]
+
+    for row in reader:
+        if len(row) < width:
+            continue
+
+        cleaned_row = []
+        for val, clean in zip(pick(row), clean_names):
+            val = val.strip()
+
+            # Validation
+            if not val or val.lower() in _MISSING_TOKENS:
+                break
+
+            # Specific cleanup
+            if clean == 'species' and '(' in val:
+                val = val.split()[0]
+            if clean == 'sex':
+                val = val.lower()
+
+            cleaned_row.append(val)
+        else:
+            yield cleaned_row
+
+
 def preprocess_penguins_data(input_file='penguins.csv', output_file='penguins_data.csv', data_dir='./data'):
     """Cleans raw data and saves to new file"""
     column_mapping = {
@@ -48,49 +102,43 @@ def preprocess_penguins_data(input_file='penguins.csv', output_file='penguins_da
     if not os.path.exists(input_path):
         return
 
+    # The cleaned rows go to a temporary file that only replaces the output once the
+    # whole input has been read, so a failed run leaves no partial output behind and
+    # the input may also be cleaned in place
+    temp_path = output_path + '.tmp'
+
     try:
-        filtered_data = []
-        with open(input_path, 'r', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            input_fieldnames = reader.fieldnames or []
+        row_count = 0
+        # Rows are streamed straight from the reader to the writer, so the
+        # cleaned dataset is never held in memory as a whole
+        with open(input_path, 'r', encoding='utf-8', newline='', buffering=_IO_BUFFER_SIZE) as infile, \
+                open(temp_path, 'w', encoding='utf-8', newline='', buffering=_IO_BUFFER_SIZE) as outfile:
+            reader = csv.reader(infile)
+            input_fieldnames = next(reader, [])
 
             # Check if input is already clean (has snake_case headers)
             # If so, update mapping to identity
             if set(required_fields).issubset(set(input_fieldnames)):
                 column_mapping = {f: f for f in required_fields}
 
-            for row in reader:
-                has_all_data = True
-                cleaned_row = {}
-
-                for raw, clean in column_mapping.items():
-                    val = row.get(raw, '').strip()
-
-                    # Validation
-                    if not val or val.lower() in ['na', 'n/a', 'nan', 'null', '.', '']:
-                        has_all_data = False
-                        break
+            # Resolve each wanted column to its position once (None if the header lacks it)
+            positions = [
+                (input_fieldnames.index(raw) if raw in input_fieldnames else None, clean)
+                for raw, clean in column_mapping.items()
+            ]
 
-                    # Specific cleanup
-                    if clean == 'species' and '(' in val:
-                        val = val.split()[0]
-                    if clean == 'sex':
-                        val = val.lower()
-                    if val == '.':
-                        has_all_data = False
-                        break
+            writer = csv.writer(outfile)
+            writer.writerow(required_fields)
+            for cleaned_row in _clean_rows(reader, positions):
+                writer.writerow(cleaned_row)
+                row_count += 1
 
-                    cleaned_row[clean] = val
-
-                if has_all_data:
-                    filtered_data.append(cleaned_row)
-
-        with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=required_fields)
-            writer.writeheader()
-            writer.writerows(filtered_data)
-
-        print(f"Cleaned data saved to {output_file}. Rows: {len(filtered_data)}")
+        os.replace(temp_path, output_path)
+        print(f"Cleaned data saved to {output_file}. Rows: {row_count}")
 
     except Exception as e:
-        print(f"Error preprocessing: {e}")
\ No newline at end of file
+        print(f"Error preprocessing: {e}")
+
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
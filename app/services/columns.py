@@ -0,0 +1,171 @@
+import sys
+from array import array
+from typing import List, Dict, Tuple, Iterable, Optional
+
+
+class ColumnStore:
+    """
+    A column-oriented view over a list of penguin rows.
+
+    Columns are extracted the first time they are requested and then cached,
+    so repeated statistics and filters on the same attribute do not walk and
+    re-parse every row dictionary again. Numeric columns are kept as contiguous
+    float64 arrays next to the indices of the rows they were read from.
+    """
+
+    # Columns with at most this many distinct values are treated as categorical
+    CATEGORICAL_MAX_DISTINCT = 64
+
+    def __init__(self, rows: List[Dict]):
+        self.rows = rows
+        self._numeric = {}
+        self._text = {}
+        self._sort_keys = {}
+        self._stats = {}
+        self._categories = {}
+
+    def intern_categorical(self) -> List[str]:
+        """
+        Interns the values of low-cardinality string columns (species, island, sex...) in place.
+
+        Repeated values then share a single string object, which saves memory on
+        large files and lets equality checks in filters succeed on identity.
+
+        Returns:
+            List[str]: The columns that were detected as categorical.
+        """
+        if not self.rows:
+            return []
+        categorical = []
+        for attribute in self.rows[0]:
+            # The None key holds the surplus fields of an over-long row (a list), never a category
+            if attribute is None:
+                continue
+            distinct = set()
+            for row in self.rows:
+                value = row.get(attribute)
+                if not isinstance(value, str):
+                    break
+                distinct.add(value)
+                if len(distinct) > self.CATEGORICAL_MAX_DISTINCT:
+                    break
+            else:
+                categorical.append(attribute)
+
+        for attribute in categorical:
+            interned = {value: sys.intern(value) for value in self.text(attribute)}
+            for row in self.rows:
+                row[attribute] = interned[row[attribute]]
+            self._text[attribute] = [row[attribute] for row in self.rows]
+        return categorical
+
+    def numeric(self, attribute: str) -> Tuple[array, array]:
+        """
+        Returns the parsed values of a numeric column.
+
+        Args:
+            attribute (str): The numeric column to extract.
+
+        Returns:
+            Tuple[array, array]: The float values and the index of the row each
+            value belongs to. Rows without a valid number are left out.
+        """
+        if attribute not in self._numeric:
+            values = array('d')
+            indices = array('q')
+            for i, row in enumerate(self.rows):
+                # Missing and empty cells are skipped up front; raising and catching
+                # an exception for each of them costs far more than the check
+                value = row.get(attribute)
+                if value is None or value == '':
+                    continue
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    continue
+                values.append(value)
+                indices.append(i)
+            self._numeric[attribute] = (values, indices)
+        return self._numeric[attribute]
+
+    def stats(self, attribute: str) -> Optional[Tuple[float, float, float]]:
+        """
+        Returns the (min, max, mean) of a numeric column, or None if it has no valid values.
+
+        The reductions run in C over the cached float array and the result is
+        kept, so describing the same column again costs a dictionary lookup.
+
+        Args:
+            attribute (str): The numeric column to summarise.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: The column statistics.
+        """
+        if attribute not in self._stats:
+            values, _ = self.numeric(attribute)
+            self._stats[attribute] = (
+                (min(values), max(values), sum(values) / len(values)) if values else None
+            )
+        return self._stats[attribute]
+
+    def text(self, attribute: str) -> List[Optional[str]]:
+        """
+        Returns the raw values of a column, one entry per row (None if missing).
+
+        Args:
+            attribute (str): The column to extract.
+
+        Returns:
+            List[Optional[str]]: The column values in row order.
+        """
+        if attribute not in self._text:
+            self._text[attribute] = [row.get(attribute) for row in self.rows]
+        return self._text[attribute]
+
+    def categories(self, attribute: str) -> Tuple[List[str], array]:
+        """
+        Returns a column encoded as category codes.
+
+        Args:
+            attribute (str): The categorical column to encode.
+
+        Returns:
+            Tuple[List[str], array]: The distinct values in order of first appearance,
+            and for every row the position of its value in that list (-1 if missing or empty).
+        """
+        if attribute not in self._categories:
+            positions = {}
+            codes = array('q', [
+                positions.setdefault(value, len(positions)) if value else -1
+                for value in self.text(attribute)
+            ])
+            self._categories[attribute] = (list(positions), codes)
+        return self._categories[attribute]
+
+    def sort_keys(self, attribute: str, numeric: bool) -> List:
+        """
+        Returns one comparable key per row, as used by the sorting algorithms.
+
+        Args:
+            attribute (str): The column to sort by.
+            numeric (bool): Whether the column holds numbers.
+
+        Returns:
+            List: Floats for numeric columns (inf where the value is missing or
+            invalid), strings otherwise. The list is shared and must not be modified.
+        """
+        cache_key = (attribute, numeric)
+        if cache_key not in self._sort_keys:
+            if numeric:
+                values, indices = self.numeric(attribute)
+                keys = [float('inf')] * len(self.rows)
+                for i, value in zip(indices, values):
+                    keys[i] = value
+            else:
+                keys = [str(row.get(attribute, '')) for row in self.rows]
+            self._sort_keys[cache_key] = keys
+        return self._sort_keys[cache_key]
+
+    def take(self, indices: Iterable[int]) -> List[Dict]:
+        """Returns the rows found at the given indices, in that order."""
+        return list(map(self.rows.__getitem__, indices))
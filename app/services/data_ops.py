@@ -1,10 +1,16 @@
+import bisect
 import random
 import itertools
-from typing import List, Dict, Any, Tuple
+import sys
+import operator
+import os
+from collections import Counter
+from typing import List, Dict, Any, Tuple, Optional
 from app.exceptions import (
     FileNotLoadedException, InvalidColumnException,
     NonNumericAttributeException, PenguinDataException
 )
+from app.services.columns import ColumnStore
 
 
 class DataOperations:
@@ -14,16 +20,20 @@ class DataOperations:
     grouping algorithms.
     """
 
-    NUMERIC_COLUMNS = {
+    # Immutable sets, so every 'attribute in ...' check is a single hash lookup
+    NUMERIC_COLUMNS = frozenset({
         'Flipper Length (mm)', 'Culmen Length (mm)', 'Culmen Depth (mm)', 'Body Mass (g)',
         'flipper_length_mm', 'culmen_length_mm', 'culmen_depth_mm', 'body_mass_g'
-    }
-    STRING_COLUMNS = {
+    })
+    STRING_COLUMNS = frozenset({
         'Species', 'Island', 'Sex', 'species', 'island', 'sex'
-    }
+    })
+    # Number of synthetic values from which augment_data generates columns in parallel processes
+    PARALLEL_AUGMENT_MIN_VALUES = 500_000
 
     @staticmethod
-    def filter_data(data: List[Dict], attribute: str, value: str) -> List[Dict]:
+    def filter_data(data: List[Dict], attribute: str, value: str,
+                    columns: Optional[ColumnStore] = None) -> List[Dict]:
         """
         Filters the dataset based on a specific attribute and value.
 
@@ -31,6 +41,7 @@ class DataOperations:
             data (List[Dict]): The dataset to filter.
             attribute (str): The column name to filter by.
             value (str): The value to match (or threshold for numeric columns).
+            columns (ColumnStore, optional): A cached column view of data. Built on the fly if omitted.
 
         Returns:
             List[Dict]: A list of dictionaries representing the filtered rows.
@@ -43,34 +54,37 @@ class DataOperations:
             raise FileNotLoadedException("No data loaded. Please load a file first.")
         if attribute not in data[0]:
             raise InvalidColumnException(f"The specified column '{attribute}' does not exist.")
+        if columns is None:
+            columns = ColumnStore(data)
 
-        filtered = []
         if attribute in DataOperations.NUMERIC_COLUMNS:
             try:
                 numeric_value = float(value)
-                for row in data:
-                    try:
-                        if float(row[attribute]) > numeric_value:
-                            filtered.append(row)
-                    except (ValueError, KeyError):
-                        continue
             except ValueError:
                 # Fallback if user provides non-numeric filter for numeric col
-                pass
-        else:
-            for row in data:
-                if row.get(attribute) == value:
-                    filtered.append(row)
-        return filtered
+                return []
+            values, indices = columns.numeric(attribute)
+            above = map(numeric_value.__lt__, values)
+            if len(values) == len(data):
+                # Every row holds a valid number, so the mask lines up with the rows directly
+                return list(itertools.compress(data, above))
+            return columns.take(itertools.compress(indices, above))
+
+        # Loaded categorical values are interned (see ColumnStore.intern_categorical),
+        # so equal strings usually compare by identity
+        matches = map(operator.eq, columns.text(attribute), itertools.repeat(sys.intern(value)))
+        return list(itertools.compress(data, matches))
 
     @staticmethod
-    def describe_attribute(data: List[Dict], attribute: str) -> Tuple[float, float, float]:
+    def describe_attribute(data: List[Dict], attribute: str,
+                           columns: Optional[ColumnStore] = None) -> Tuple[float, float, float]:
         """
         Calculates basic statistics (min, max, mean) for a numeric attribute.
 
         Args:
             data (List[Dict]): The dataset.
             attribute (str): The numeric column to analyze.
+            columns (ColumnStore, optional): A cached column view of data. Built on the fly if omitted.
 
         Returns:
             Tuple[float, float, float]: A tuple containing (min, max, mean).
@@ -85,27 +99,26 @@ class DataOperations:
             raise InvalidColumnException(f"Column '{attribute}' does not exist.")
         if attribute not in DataOperations.NUMERIC_COLUMNS:
             raise NonNumericAttributeException(f"'{attribute}' is not numeric.")
+        if columns is None:
+            columns = ColumnStore(data)
 
-        values = []
-        for row in data:
-            try:
-                values.append(float(row[attribute]))
-            except (ValueError, KeyError):
-                continue
+        stats = columns.stats(attribute)
 
-        if not values:
+        if stats is None:
             raise PenguinDataException(f"No valid numeric values found for '{attribute}'")
 
-        return min(values), max(values), sum(values) / len(values)
+        return stats
 
     @staticmethod
-    def unique_values(data: List[Dict], attribute: str) -> Dict[str, int]:
+    def unique_values(data: List[Dict], attribute: str,
+                      columns: Optional[ColumnStore] = None) -> Dict[str, int]:
         """
         Counts the occurrences of unique values for a specific attribute.
 
         Args:
             data (List[Dict]): The dataset.
             attribute (str): The column to analyze.
+            columns (ColumnStore, optional): A cached column view of data. Built on the fly if omitted.
 
         Returns:
             Dict[str, int]: A dictionary mapping unique values to their counts.
@@ -115,12 +128,11 @@ class DataOperations:
         if attribute not in data[0]:
             raise InvalidColumnException(f"Column '{attribute}' does not exist.")
 
-        counts = {}
-        for row in data:
-            val = row.get(attribute, '')
-            if val:
-                counts[val] = counts.get(val, 0) + 1
-        return counts
+        if columns is None:
+            columns = ColumnStore(data)
+
+        # Empty values are not counted
+        return dict(Counter(filter(None, columns.text(attribute))))
 
     @staticmethod
     def augment_data(data: List[Dict], percent: int, method: str) -> List[Dict]:
@@ -142,28 +154,57 @@ class DataOperations:
         new_data = data.copy()
 
         if method == 'duplicate':
-            for _ in range(num_to_add):
-                new_data.append(random.choice(data).copy())
+            # One batched draw; each pick is copied so the new rows never alias the originals
+            new_data.extend(map(dict.copy, random.choices(data, k=num_to_add)))
         elif method == 'create':
             columns = list(data[0].keys())
-            # Simple random generation based on existing data range
-            for _ in range(num_to_add):
-                new_row = {}
-                for col in columns:
-                    if col in DataOperations.NUMERIC_COLUMNS:
-                        vals = [float(r[col]) for r in data if r.get(col)]
-                        if vals:
-                            new_row[col] = round(random.uniform(min(vals), max(vals)), 1)
-                        else:
-                            new_row[col] = 0
-                    elif col in DataOperations.STRING_COLUMNS:
-                        vals = [r[col] for r in data if r.get(col)]
-                        new_row[col] = random.choice(vals) if vals else ''
+            store = ColumnStore(data)
+            # Simple random generation based on existing data range.
+            # Each column is generated in one go, so ranges and choices are computed once per column.
+            column_values = [[''] * num_to_add for _ in columns]
+            jobs = {}
+            for pos, col in enumerate(columns):
+                if col in DataOperations.NUMERIC_COLUMNS:
+                    vals, _ = store.numeric(col)
+                    if vals:
+                        jobs[pos] = (DataOperations._generate_numeric_column,
+                                     (min(vals), max(vals), num_to_add, random.getrandbits(64)))
                     else:
-                        new_row[col] = ''
-                new_data.append(new_row)
+                        column_values[pos] = [0] * num_to_add
+                elif col in DataOperations.STRING_COLUMNS:
+                    vals = [v for v in store.text(col) if v]
+                    if vals:
+                        jobs[pos] = (DataOperations._generate_string_column,
+                                     (vals, num_to_add, random.getrandbits(64)))
+
+            # Columns are independent, so large jobs are spread over worker processes
+            parallel = (len(jobs) > 1 and (os.cpu_count() or 1) > 1 and
+                        num_to_add * len(jobs) >= DataOperations.PARALLEL_AUGMENT_MIN_VALUES)
+            if parallel:
+                # Imported here: concurrent.futures is slow to import and only needed for large jobs
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor() as pool:
+                    futures = {pos: pool.submit(func, *args) for pos, (func, args) in jobs.items()}
+                    for pos, future in futures.items():
+                        column_values[pos] = future.result()
+            else:
+                for pos, (func, args) in jobs.items():
+                    column_values[pos] = func(*args)
+
+            new_data.extend(dict(zip(columns, values)) for values in zip(*column_values))
         return new_data
 
+    @staticmethod
+    def _generate_numeric_column(low: float, high: float, count: int, seed: int) -> List[float]:
+        """Helper method for augment_data drawing count values in [low, high], rounded to 1 decimal."""
+        rng = random.Random(seed)
+        return [round(rng.uniform(low, high), 1) for _ in range(count)]
+
+    @staticmethod
+    def _generate_string_column(choices: List[str], count: int, seed: int) -> List[str]:
+        """Helper method for augment_data drawing count values from the existing ones."""
+        return random.Random(seed).choices(choices, k=count)
+
     @staticmethod
     def get_random_subset(data: List[Dict], k: int) -> List[Dict]:
         """
@@ -186,7 +227,7 @@ class DataOperations:
         return random.sample(data, k)
 
     @staticmethod
-    def generate_research_groups(data: List[Dict], k: int) -> List[List[Dict]]:
+    def generate_research_groups(data: List[Dict], k: int) -> List[Tuple[Dict, ...]]:
         """
         Generates all possible groups of size k that contain at least one penguin
         from each species found in the dataset.
@@ -196,7 +237,7 @@ class DataOperations:
             k (int): The size of the research groups (must be >= 3).
 
         Returns:
-            List[List[Dict]]: A list of valid groups, where each group is a list of penguins.
+            List[Tuple[Dict, ...]]: A list of valid groups, where each group is a tuple of penguins.
 
         Raises:
             PenguinDataException: If dataset is too large, k is invalid, or species data is missing.
@@ -219,19 +260,35 @@ class DataOperations:
         if not available_species:
             raise PenguinDataException("No species data found in the dataset.")
 
-        valid_groups = []
-
-        # Generate all combinations of size k
-        for group in itertools.combinations(data, k):
-            group_species = {row.get('species') or row.get('Species') for row in group}
-            # Check if all available species are represented in this group
-            if available_species.issubset(group_species):
-                valid_groups.append(list(group))
+        # Give every species its own bit so a group's coverage is a single integer
+        species_bits = {species: 1 << i for i, species in enumerate(sorted(available_species))}
+        all_species = (1 << len(species_bits)) - 1
+        row_bits = [species_bits.get(row.get('species') or row.get('Species'), 0) for row in data]
 
+        n = len(data)
+        valid_groups = []
+        chosen = []
+
+        # Depth-first search over index combinations (same order as itertools.combinations),
+        # abandoning a branch as soon as the remaining picks cannot cover the missing species
+        def extend(start, covered):
+            remaining = k - len(chosen)
+            if remaining == 0:
+                if covered == all_species:
+                    valid_groups.append(tuple(map(data.__getitem__, chosen)))
+                return
+            if (all_species & ~covered).bit_count() > remaining:
+                return
+            for i in range(start, n - remaining + 1):
+                chosen.append(i)
+                extend(i + 1, covered | row_bits[i])
+                chosen.pop()
+
+        extend(0, 0)
         return valid_groups
 
     @staticmethod
-    def split_penguins(data: List[Dict], threshold: float) -> List[Tuple[List[Dict], List[Dict]]]:
+    def split_penguins(data: List[Dict], threshold: float) -> List[Tuple[Tuple[Dict, ...], Tuple[Dict, ...]]]:
         """
         Generates all possible ways to split the penguins into two groups such that:
         1. Each group has at least 2 penguins.
@@ -242,7 +299,8 @@ class DataOperations:
             threshold (float): The maximum allowed body mass sum for a group.
 
         Returns:
-            List[Tuple[List[Dict], List[Dict]]]: A list of tuples, where each tuple contains (Group1, Group2).
+            List[Tuple[Tuple[Dict, ...], Tuple[Dict, ...]]]: A list of (Group1, Group2) pairs, each group
+            being a tuple of penguins.
 
         Raises:
             PenguinDataException: If the dataset is too large or too small.
@@ -257,94 +315,149 @@ class DataOperations:
         results = []
         n = len(data)
 
-        # Helper to calculate mass
-        def get_mass(penguin):
-            try:
-                # Handle keys for both raw and processed data
-                key = 'body_mass_g' if 'body_mass_g' in penguin else 'Body Mass (g)'
-                return float(penguin.get(key, 0))
-            except (ValueError, TypeError):
-                return 0.0
-
-        # Fix the first element to Group 1 to avoid duplicate partitions (e.g. {A, B} vs {B, A})
-        first_penguin = data[0]
-        other_penguins = data[1:]
+        # Masses are looked up once; each candidate split then only adds up cached floats
+        masses = [DataOperations.body_mass(p) for p in data]
+
+        # Fix the first element (index 0) to Group 1 to avoid duplicate partitions (e.g. {A, B} vs {B, A}).
+        # Every other penguin is assigned to Group 1 or Group 2 by a depth-first branch and bound,
+        # heaviest first: when no mass is negative, a branch is abandoned as soon as either group's
+        # running mass exceeds the threshold. The limit allows for rounding, because the running
+        # sums add up in a different order than the exact check below; with a negative mass
+        # nothing is pruned and every split is checked.
+        if min(masses) >= 0:
+            limit = threshold + 1e-9 * max(1.0, abs(threshold), sum(masses))
+        else:
+            limit = float('inf')
+        others = sorted(range(1, n), key=masses.__getitem__, reverse=True)
+        candidates = []
+        chosen = []
 
-        # Iterate through possible sizes for Group 1.
         # Group 1 must have at least 2 elements, so we pick at least 1 more from 'others'.
         # Group 2 must have at least 2 elements, so Group 1 can have at most N-2 elements.
         # Range of items to pick from 'others': 1 to (N-2) - 1 => 1 to N-3
-        for num_pick in range(1, n - 2):
-            for chosen_others in itertools.combinations(other_penguins, num_pick):
-                group_1 = [first_penguin] + list(chosen_others)
+        max_pick = n - 3
+
+        def assign(pos, mass_1, mass_2):
+            if pos == len(others):
+                if chosen:
+                    candidates.append(tuple(sorted(chosen)))
+                return
+            idx = others[pos]
+            if len(chosen) < max_pick and mass_1 + masses[idx] <= limit:
+                chosen.append(idx)
+                assign(pos + 1, mass_1 + masses[idx], mass_2)
+                chosen.pop()
+            if mass_2 + masses[idx] <= limit:
+                assign(pos + 1, mass_1, mass_2 + masses[idx])
+
+        if masses[0] <= limit:
+            assign(0, masses[0], 0.0)
+
+        # Report splits ordered by Group 1 size, then by row index
+        candidates.sort(key=lambda chosen_others: (len(chosen_others), chosen_others))
+        for chosen_others in candidates:
+            # Group 2 is everyone not in Group 1, tracked as a bitmask of row indices.
+            # Both sums run in row order, so they are exactly the sums of the listed groups.
+            group_1_mask = 1
+            for i in chosen_others:
+                group_1_mask |= 1 << i
+            others_2 = [i for i in range(n) if not group_1_mask >> i & 1]
+            mass_1 = sum(map(masses.__getitem__, chosen_others), masses[0])
+            mass_2 = sum(map(masses.__getitem__, others_2))
+
+            if mass_1 <= threshold and mass_2 <= threshold:
+                group_1 = (data[0], *map(data.__getitem__, chosen_others))
+                group_2 = tuple(map(data.__getitem__, others_2))
+                results.append((group_1, group_2))
 
-                # Group 2 is everyone not in Group 1. Using object identity logic via list reconstruction
-                # Note: This relies on data containing unique dict objects
-                g1_ids = {id(p) for p in group_1}
-                group_2 = [p for p in data if id(p) not in g1_ids]
+        return results
 
-                mass_1 = sum(get_mass(p) for p in group_1)
-                mass_2 = sum(get_mass(p) for p in group_2)
+    @staticmethod
+    def body_mass(penguin: Dict) -> float:
+        """Returns a penguin's body mass, or 0.0 if it is missing or invalid."""
+        try:
+            # Handle keys for both raw and processed data
+            key = 'body_mass_g' if 'body_mass_g' in penguin else 'Body Mass (g)'
+            return float(penguin.get(key, 0))
+        except (ValueError, TypeError):
+            return 0.0
 
-                if mass_1 <= threshold and mass_2 <= threshold:
-                    results.append((group_1, group_2))
+    # --- Sorting Algorithms ---
+    # Every algorithm extracts the comparison keys once up front and then sorts a
+    # permutation of row indices, so the inner loops only compare ready-made values.
+    # When a ColumnStore is passed, the keys come from its cache and are reused by later sorts.
 
-        return results
+    @staticmethod
+    def _extract_keys(data: List[Dict], key: str, columns: Optional[ColumnStore] = None) -> List[Any]:
+        """
+        Helper method returning the comparable value of every row, in row order.
 
-    # --- Sorting Algorithms ---
+        Numeric columns yield floats (inf for missing or invalid values), other columns
+        yield strings. Whether the key is numeric is decided once, not once per row.
+        """
+        if columns is None:
+            columns = ColumnStore(data)
+        return columns.sort_keys(key, key in DataOperations.NUMERIC_COLUMNS)
 
     @staticmethod
-    def _get_comparable_value(row: Dict, key: str) -> Any:
-        """Helper method to safely extract and cast values for comparison."""
-        value = row.get(key, '')
-        if key in DataOperations.NUMERIC_COLUMNS:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return float('inf')
-        return str(value)
+    def tim_sort(data: List[Dict], key: str, reverse: bool = False,
+                 columns: Optional[ColumnStore] = None) -> List[Dict]:
+        """Sorts data using Python's built-in Timsort (stable, implemented in C)."""
+        keys = DataOperations._extract_keys(data, key, columns)
+        order = sorted(range(len(data)), key=keys.__getitem__, reverse=reverse)
+        return [data[i] for i in order]
 
     @staticmethod
-    def bubble_sort(data: List[Dict], key: str, reverse: bool = False) -> List[Dict]:
+    def bubble_sort(data: List[Dict], key: str, reverse: bool = False,
+                    columns: Optional[ColumnStore] = None) -> List[Dict]:
         """Sorts data using the Bubble Sort algorithm."""
-        result = data.copy()
-        n = len(result)
+        keys = DataOperations._extract_keys(data, key, columns)
+        order = list(range(len(data)))
+        n = len(order)
         for i in range(n):
             swapped = False
             for j in range(0, n - i - 1):
-                val1 = DataOperations._get_comparable_value(result[j], key)
-                val2 = DataOperations._get_comparable_value(result[j + 1], key)
+                val1 = keys[order[j]]
+                val2 = keys[order[j + 1]]
 
                 if reverse:
                     if val1 < val2:
-                        result[j], result[j + 1] = result[j + 1], result[j]
+                        order[j], order[j + 1] = order[j + 1], order[j]
                         swapped = True
                 else:
                     if val1 > val2:
-                        result[j], result[j + 1] = result[j + 1], result[j]
+                        order[j], order[j + 1] = order[j + 1], order[j]
                         swapped = True
             if not swapped:
                 break
-        return result
+        return [data[i] for i in order]
 
     @staticmethod
-    def merge_sort(data: List[Dict], key: str, reverse: bool = False) -> List[Dict]:
+    def merge_sort(data: List[Dict], key: str, reverse: bool = False,
+                   columns: Optional[ColumnStore] = None) -> List[Dict]:
         """Sorts data using the Merge Sort algorithm (recursive)."""
-        if len(data) <= 1:
-            return data
-        mid = len(data) // 2
-        left = DataOperations.merge_sort(data[:mid], key, reverse)
-        right = DataOperations.merge_sort(data[mid:], key, reverse)
-        return DataOperations._merge(left, right, key, reverse)
+        keys = DataOperations._extract_keys(data, key, columns)
+        order = DataOperations._merge_sort_indices(list(range(len(data))), keys, reverse)
+        return [data[i] for i in order]
 
     @staticmethod
-    def _merge(left, right, key, reverse):
-        """Helper method for merge_sort to combine two sorted lists."""
+    def _merge_sort_indices(order, keys, reverse):
+        """Helper method for merge_sort that recursively sorts a list of row indices."""
+        if len(order) <= 1:
+            return order
+        mid = len(order) // 2
+        left = DataOperations._merge_sort_indices(order[:mid], keys, reverse)
+        right = DataOperations._merge_sort_indices(order[mid:], keys, reverse)
+        return DataOperations._merge(left, right, keys, reverse)
+
+    @staticmethod
+    def _merge(left, right, keys, reverse):
+        """Helper method for merge_sort to combine two sorted lists of row indices."""
         result = []
         i = j = 0
         while i < len(left) and j < len(right):
-            l_val = DataOperations._get_comparable_value(left[i], key)
-            r_val = DataOperations._get_comparable_value(right[j], key)
+            l_val = keys[left[i]]
+            r_val = keys[right[j]]
 
             condition = (l_val >= r_val) if reverse else (l_val <= r_val)
             if condition:
@@ -358,68 +471,88 @@ class DataOperations:
         return result
 
     @staticmethod
-    def quick_sort(data: List[Dict], key: str, reverse: bool = False) -> List[Dict]:
+    def quick_sort(data: List[Dict], key: str, reverse: bool = False,
+                   columns: Optional[ColumnStore] = None) -> List[Dict]:
         """Sorts data using the Quick Sort algorithm."""
-        if len(data) <= 1:
-            return data
-        pivot = data[len(data) // 2]
-        pivot_val = DataOperations._get_comparable_value(pivot, key)
-
-        left = []
-        middle = []
-        right = []
-
-        for item in data:
-            val = DataOperations._get_comparable_value(item, key)
-            if val < pivot_val:
-                left.append(item)
-            elif val > pivot_val:
-                right.append(item)
+        keys = DataOperations._extract_keys(data, key, columns)
+        order = DataOperations._quick_sort_indices(list(range(len(data))), keys, reverse)
+        return [data[i] for i in order]
+
+    @staticmethod
+    def _quick_sort_indices(order, keys, reverse):
+        """Helper method for quick_sort that sorts a list of row indices in place, without recursion."""
+        # Pending (lo, hi) ranges; the smaller side is pushed last so the stack stays O(log n)
+        stack = [(0, len(order) - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            pivot = order[(lo + hi) // 2]
+            pivot_val = keys[pivot]
+
+            # Three-way partition: [lo, lt) before pivot, [lt, i) equal, (gt, hi] after pivot.
+            # Equal keys are ordered by row index, so rows with the same key keep their original order.
+            lt, i, gt = lo, lo, hi
+            while i <= gt:
+                idx = order[i]
+                val = keys[idx]
+                before, after = (val > pivot_val, val < pivot_val) if reverse else (val < pivot_val, val > pivot_val)
+                if before or (not after and idx < pivot):
+                    order[lt], order[i] = order[i], order[lt]
+                    lt += 1
+                    i += 1
+                elif after or idx > pivot:
+                    order[i], order[gt] = order[gt], order[i]
+                    gt -= 1
+                else:
+                    i += 1
+
+            if lt - lo > hi - gt:
+                stack.append((lo, lt - 1))
+                stack.append((gt + 1, hi))
             else:
-                middle.append(item)
+                stack.append((gt + 1, hi))
+                stack.append((lo, lt - 1))
+        return order
 
+    @staticmethod
+    def insertion_sort(data: List[Dict], key: str, reverse: bool = False,
+                       columns: Optional[ColumnStore] = None) -> List[Dict]:
+        """
+        Sorts data using the (binary) Insertion Sort algorithm.
+
+        Each row is inserted into the sorted prefix with bisect.insort, so locating the
+        slot and shifting the larger items both happen in C.
+        """
+        keys = DataOperations._extract_keys(data, key, columns)
+        order = []
         if reverse:
-            return DataOperations.quick_sort(right, key, reverse) + middle + DataOperations.quick_sort(left, key,
-                                                                                                       reverse)
+            # Build ascending from the last row backwards, then flip: equal keys keep their original order
+            for idx in range(len(data) - 1, -1, -1):
+                bisect.insort(order, idx, key=keys.__getitem__)
+            order.reverse()
         else:
-            return DataOperations.quick_sort(left, key, reverse) + middle + DataOperations.quick_sort(right, key,
-                                                                                                      reverse)
+            for idx in range(len(data)):
+                bisect.insort(order, idx, key=keys.__getitem__)
+        return [data[i] for i in order]
 
     @staticmethod
-    def insertion_sort(data: List[Dict], key: str, reverse: bool = False) -> List[Dict]:
-        """Sorts data using the Insertion Sort algorithm."""
-        result = data.copy()
-        for i in range(1, len(result)):
-            key_item = result[i]
-            key_val = DataOperations._get_comparable_value(key_item, key)
-            j = i - 1
-            while j >= 0:
-                comp_val = DataOperations._get_comparable_value(result[j], key)
-                condition = (comp_val < key_val) if reverse else (comp_val > key_val)
-
-                if condition:
-                    result[j + 1] = result[j]
-                    j -= 1
-                else:
-                    break
-            result[j + 1] = key_item
-        return result
+    def selection_sort(data: List[Dict], key: str, reverse: bool = False,
+                       columns: Optional[ColumnStore] = None) -> List[Dict]:
+        """
+        Sorts data using the Selection Sort algorithm.
 
-    @staticmethod
-    def selection_sort(data: List[Dict], key: str, reverse: bool = False) -> List[Dict]:
-        """Sorts data using the Selection Sort algorithm."""
-        result = data.copy()
-        for i in range(len(result)):
-            extreme_idx = i
-            extreme_val = DataOperations._get_comparable_value(result[i], key)
-
-            for j in range(i + 1, len(result)):
-                curr_val = DataOperations._get_comparable_value(result[j], key)
-                condition = (curr_val > extreme_val) if reverse else (curr_val < extreme_val)
-
-                if condition:
-                    extreme_idx = j
-                    extreme_val = curr_val
-
-            result[i], result[extreme_idx] = result[extreme_idx], result[i]
-        return result
\ No newline at end of file
+        The scan for the smallest (largest) remaining key is done by the built-in
+        min (max) and list.index, which run in C.
+        """
+        keys = DataOperations._extract_keys(data, key, columns)
+        order = list(range(len(data)))
+        vals = list(keys)
+        find_extreme = max if reverse else min
+        for i in range(len(order)):
+            extreme_val = find_extreme(itertools.islice(vals, i, None))
+            extreme_idx = vals.index(extreme_val, i)
+
+            vals[i], vals[extreme_idx] = vals[extreme_idx], vals[i]
+            order[i], order[extreme_idx] = order[extreme_idx], order[i]
+        return [data[i] for i in order]
@@ -1,57 +1,186 @@
 import os
 import csv
+import operator
+import re
+import shutil
+import weakref
+from collections import Counter, OrderedDict
 from datetime import datetime
 from typing import List, Dict
+from app.services.columns import ColumnStore
+
+# Buffer size for whole-file CSV reads and writes (1 MiB, instead of the 8 KiB default).
+# The sorting log only appends one short line at a time and is written unbuffered.
+_IO_BUFFER_SIZE = 1 << 20
+
+# Runs of characters that are replaced by a single '_' in normalized column names
+_NON_IDENTIFIER_CHARS = re.compile(r'[^0-9a-z]+')
 
 
 class FileOperations:
+    CSV_EXTENSION = '.csv'
+    # Number of parsed files kept in memory by load_csv
+    CACHE_SIZE = 16
+
     def __init__(self, data_directory: str = "./data"):
         self.data_directory = data_directory
-        if not os.path.exists(data_directory):
-            os.makedirs(data_directory)
+        os.makedirs(data_directory, exist_ok=True)
+        # Absolute path -> ((mtime_ns, size), ColumnStore over the rows), least recently used first
+        self._cache = OrderedDict()
+        self._log_file = None
+        self._close_log_file = None
 
     def list_csv_files(self) -> List[str]:
-        if not os.path.exists(self.data_directory):
+        try:
+            with os.scandir(self.data_directory) as entries:
+                return [e.name for e in entries if e.name.endswith(self.CSV_EXTENSION) and e.is_file()]
+        except FileNotFoundError:
             return []
-        return [f for f in os.listdir(self.data_directory) if f.endswith('.csv')]
 
     def load_csv(self, filename: str) -> List[Dict]:
+        # Column names are normalized to snake_case (see normalize_column_name).
+        # Callers get their own list, but the row dictionaries are shared and must be treated as read-only
+        return list(self._load_cached(filename).rows)
+
+    def load_csv_columns(self, filename: str) -> ColumnStore:
+        # Column-oriented view of the file; parsed columns are kept with the cached rows,
+        # so reloading an unchanged file reuses them as well
+        return self._load_cached(filename)
+
+    def _load_cached(self, filename: str) -> ColumnStore:
         filepath = os.path.join(self.data_directory, filename)
-        if not os.path.exists(filepath):
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
             raise FileNotFoundError(f"File '{filename}' not found in {self.data_directory}")
 
-        data = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                data.append(row)
-        return data
+        # Reuse the parsed file while it is unchanged
+        cache_key = os.path.abspath(filepath)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            self._cache.move_to_end(cache_key)
+            return cached[1]
+
+        columns = ColumnStore(self._read_csv(filepath))
+        # Done once per parse, so reloading a cached file does not walk the rows again
+        columns.intern_categorical()
+        self._cache[cache_key] = (stamp, columns)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return columns
+
+    def _read_csv(self, filepath: str) -> List[Dict]:
+        with open(filepath, 'r', encoding='utf-8', newline='', buffering=_IO_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
+            header = self._normalize_header(header)
+            width = len(header)
+            # Plain csv.reader plus a dict(zip()) per row is cheaper than csv.DictReader;
+            # blank lines are skipped and ragged rows handled the same way DictReader does
+            return [
+                dict(zip(header, row)) if len(row) == width else self._ragged_row_to_dict(header, row)
+                for row in reader if row
+            ]
+
+    @staticmethod
+    def _ragged_row_to_dict(header: List[str], row: List[str]) -> Dict:
+        """Maps a row with too few or too many fields like csv.DictReader does."""
+        record = dict(zip(header, row))
+        if len(row) > len(header):
+            record[None] = row[len(header):]
+        else:
+            for name in header[len(row):]:
+                record[name] = None
+        return record
+
+    @staticmethod
+    def normalize_column_name(name: str) -> str:
+        # 'Body Mass (g)' -> 'body_mass_g', so raw and cleaned files share the same column names
+        return _NON_IDENTIFIER_CHARS.sub('_', name.strip().lower()).strip('_')
 
-    def save_csv(self, filename: str, data: List[Dict]) -> None:
+    @classmethod
+    def _normalize_header(cls, header: List[str]) -> List[str]:
+        # Columns whose names would collide once normalized ('Body Mass (g)' next to 'body_mass_g',
+        # or several blank headers) keep their original names, so none of them overwrites another
+        normalized = [cls.normalize_column_name(name) for name in header]
+        counts = Counter(normalized)
+        return [new if counts[new] == 1 else name for name, new in zip(header, normalized)]
+
+    @staticmethod
+    def ensure_csv_ext(filename: str) -> str:
+        if filename.endswith(FileOperations.CSV_EXTENSION):
+            return filename
+        return filename + FileOperations.CSV_EXTENSION
+
+    def save_csv(self, filename: str, data: List[Dict]) -> str:
+        # Returns the name actually used, with the .csv extension added if it was missing
+        filename = self.ensure_csv_ext(filename)
         if not data:
-            return
+            return filename
         filepath = os.path.join(self.data_directory, filename)
-        with open(filepath, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+        self._cache.pop(os.path.abspath(filepath), None)
+        fieldnames = list(data[0])
+        width = len(fieldnames)
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=_IO_BUFFER_SIZE) as f:
+            if width > 1 and all(len(row) == width for row in data):
+                # Every row has the same columns: pull the values out with one itemgetter call
+                # per row and use the plain writer, skipping DictWriter's per-row key checks
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(map(operator.itemgetter(*fieldnames), data))
+            else:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(data)
+        return filename
 
-    def log_sorting(self, num_rows: int, algorithm: str, execution_time: float) -> None:
-        log_file = os.path.join(self.data_directory, 'sorting_log.csv')
-        file_exists = os.path.exists(log_file)
+    def has_normalized_header(self, filename: str) -> bool:
+        # True when load_csv does not rename any column, i.e. save_csv would write the same header
+        filepath = os.path.join(self.data_directory, filename)
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), [])
+        return self._normalize_header(header) == header
 
-        with open(log_file, 'a', encoding='utf-8', newline='') as f:
-            fieldnames = ['date_of_run', 'time_of_run', 'number_of_rows',
-                          'sorting_algorithm', 'execution_time_in_seconds']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+    def copy_csv(self, source_filename: str, filename: str) -> str:
+        # Saves an unchanged file under a new name by copying its bytes (sendfile where available)
+        # instead of parsing and re-serialising every row; returns the name used like save_csv
+        filename = self.ensure_csv_ext(filename)
+        source_path = os.path.join(self.data_directory, source_filename)
+        filepath = os.path.join(self.data_directory, filename)
+        self._cache.pop(os.path.abspath(filepath), None)
+        try:
+            shutil.copyfile(source_path, filepath)
+        except shutil.SameFileError:
+            pass
+        return filename
 
-            if not file_exists:
-                writer.writeheader()
+    def log_sorting(self, num_rows: int, algorithm: str, execution_time: float) -> None:
+        log_file = self._get_log_file()
+        now = datetime.now()
+        log_file.write(f"{now:%Y-%m-%d,%H:%M:%S},{num_rows},{algorithm},{execution_time:.6f}\r\n".encode())
+        self._cache.pop(os.path.abspath(log_file.name), None)
+
+    def _get_log_file(self):
+        # The log stays open for the lifetime of this object instead of being reopened per sort.
+        # It is unbuffered and binary: each entry is encoded once and reaches the file in a single write.
+        if self._log_file is None:
+            log_path = os.path.join(self.data_directory, 'sorting_log.csv')
+            log_file = open(log_path, 'ab', buffering=0)
+            if log_file.tell() == 0:
+                log_file.write(b'date_of_run,time_of_run,number_of_rows,'
+                               b'sorting_algorithm,execution_time_in_seconds\r\n')
+            # Closed by close(), or when this object is collected or the interpreter exits
+            self._close_log_file = weakref.finalize(self, log_file.close)
+            self._log_file = log_file
+        return self._log_file
 
-            writer.writerow({
-                'date_of_run': datetime.now().strftime('%Y-%m-%d'),
-                'time_of_run': datetime.now().strftime('%H:%M:%S'),
-                'number_of_rows': num_rows,
-                'sorting_algorithm': algorithm,
-                'execution_time_in_seconds': f'{execution_time:.6f}'
-            })
\ No newline at end of file
+    def close(self) -> None:
+        """Closes the sorting log; it is reopened by the next log_sorting call."""
+        if self._log_file is not None:
+            self._close_log_file()
+            self._log_file = None
+            self._close_log_file = None
@@ -0,0 +1,79 @@
+import unittest
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from app.services.cleaning import analyze_missing_data, preprocess_penguins_data
+
+RAW_HEADER = ("Species,Island,Culmen Length (mm),Culmen Depth (mm),"
+              "Flipper Length (mm),Body Mass (g),Sex\n")
+
+
+class TestCleaning(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory with a small raw dataset"""
+        self.test_dir = tempfile.mkdtemp()
+        self._write("penguins.csv",
+                    RAW_HEADER
+                    + "Adelie Penguin (Pygoscelis adeliae),Torgersen,39.1,18.7,181,3750,MALE\n"
+                    + "Adelie Penguin (Pygoscelis adeliae),Torgersen,NA,NA,NA,NA,\n"
+                    + "Gentoo penguin (Pygoscelis papua),Biscoe,46.1,13.2,211,4500,FEMALE\n")
+
+    def tearDown(self):
+        """Remove the temporary directory after tests"""
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, filename, text):
+        with open(os.path.join(self.test_dir, filename), 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+
+    def _read(self, filename):
+        with open(os.path.join(self.test_dir, filename), encoding='utf-8', newline='') as f:
+            return f.read()
+
+    def _preprocess(self, *args):
+        with redirect_stdout(io.StringIO()):
+            preprocess_penguins_data(*args, data_dir=self.test_dir)
+
+    def test_preprocess_cleans_rows(self):
+        """Test that incomplete rows are dropped and values are tidied"""
+        self._preprocess()
+
+        self.assertEqual(self._read("penguins_data.csv"),
+                         "species,island,culmen_length_mm,culmen_depth_mm,flipper_length_mm,body_mass_g,sex\r\n"
+                         "Adelie,Torgersen,39.1,18.7,181,3750,male\r\n"
+                         "Gentoo,Biscoe,46.1,13.2,211,4500,female\r\n")
+
+    def test_preprocess_in_place(self):
+        """Test that a cleaned file can be cleaned onto itself"""
+        self._preprocess()
+        expected = self._read("penguins_data.csv")
+
+        self._preprocess("penguins_data.csv", "penguins_data.csv")
+        self.assertEqual(self._read("penguins_data.csv"), expected)
+
+    def test_preprocess_read_error_leaves_no_output(self):
+        """Test that a file failing midway does not leave a partial output"""
+        with open(os.path.join(self.test_dir, "penguins.csv"), 'ab') as f:
+            f.write(b"Chinstrap,Dream,\xff\n")
+
+        self._preprocess()
+        self.assertEqual(os.listdir(self.test_dir), ["penguins.csv"])
+
+    def test_analyze_missing_data(self):
+        """Test that missing values are counted per column and blank lines are skipped"""
+        self._write("blank.csv", "a,b\n\n1,NA\n\n2,\n")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            analyze_missing_data("blank.csv", data_dir=self.test_dir)
+
+        self.assertIn("  - b: 2 missing", output.getvalue())
+        self.assertNotIn("  - a:", output.getvalue())
+        self.assertIn("Total rows: 2", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from app.services.columns import ColumnStore
+
+
+class TestColumnStore(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a sample dataset with a missing numeric value"""
+        self.sample_data = [
+            {'species': 'Adelie', 'body_mass_g': '3750'},
+            {'species': 'Gentoo', 'body_mass_g': 'NA'},
+            {'species': 'Adelie', 'body_mass_g': '3200'},
+        ]
+        self.columns = ColumnStore(self.sample_data)
+
+    def test_numeric_skips_invalid_rows(self):
+        """Test that unparsable values are skipped but row indices are kept"""
+        values, indices = self.columns.numeric('body_mass_g')
+        self.assertEqual(list(values), [3750.0, 3200.0])
+        self.assertEqual(list(indices), [0, 2])
+
+    def test_columns_are_cached(self):
+        """Test that a column is only extracted once"""
+        self.assertIs(self.columns.text('species'), self.columns.text('species'))
+        self.assertIs(self.columns.numeric('body_mass_g'), self.columns.numeric('body_mass_g'))
+
+    def test_stats_skip_invalid_rows(self):
+        """Test that min, max and mean are computed over the valid values only"""
+        self.assertEqual(self.columns.stats('body_mass_g'), (3200.0, 3750.0, 3475.0))
+        self.assertIsNone(self.columns.stats('flipper_length_mm'))
+
+    def test_categories(self):
+        """Test that categories keep first-appearance order and share codes"""
+        names, codes = self.columns.categories('species')
+        self.assertEqual(names, ['Adelie', 'Gentoo'])
+        self.assertEqual(list(codes), [0, 1, 0])
+
+    def test_intern_categorical(self):
+        """Test that only low-cardinality string columns are interned"""
+        rows = [{'species': ''.join(['Ade', 'lie']), 'id': str(i)} for i in range(100)]
+        columns = ColumnStore(rows)
+
+        self.assertEqual(columns.intern_categorical(), ['species'])
+        self.assertIs(rows[0]['species'], rows[99]['species'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from app.services.data_ops import DataOperations
+from app.services.columns import ColumnStore
 from app.exceptions import NonNumericAttributeException, InvalidColumnException
 
 class TestDataOperations(unittest.TestCase):
@@ -32,6 +33,14 @@ class TestDataOperations(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['species'], 'Gentoo')
 
+    def test_filter_data_numeric_cached_column(self):
+        """Test numeric filtering through a shared ColumnStore skips invalid values"""
+        data = self.sample_data + [{'species': 'Gentoo', 'body_mass_g': 'NA', 'flipper_length_mm': '200'}]
+        columns = ColumnStore(data)
+        result = DataOperations.filter_data(data, 'body_mass_g', '3500', columns=columns)
+        self.assertEqual([row['species'] for row in result], ['Adelie', 'Gentoo', 'Chinstrap'])
+        self.assertIs(columns.numeric('body_mass_g'), columns.numeric('body_mass_g'))
+
     def test_filter_data_string(self):
         """Test filtering by exact string match"""
         result = DataOperations.filter_data(self.sample_data, 'species', 'Adelie')
@@ -56,5 +65,21 @@ class TestDataOperations(unittest.TestCase):
         self.assertEqual(float(sorted_data[0]['flipper_length_mm']), 210)
         self.assertEqual(float(sorted_data[-1]['flipper_length_mm']), 181)
 
+    def test_quick_sort_keeps_equal_keys_in_order(self):
+        """Test Quick Sort keeps rows with equal keys in their original order"""
+        sorted_data = DataOperations.quick_sort(self.sample_data, 'body_mass_g', reverse=True)
+        self.assertEqual([row['species'] for row in sorted_data], ['Gentoo', 'Adelie', 'Chinstrap', 'Adelie'])
+
+    def test_tim_sort_desc(self):
+        """Test Tim Sort in descending order keeps equal keys stable"""
+        sorted_data = DataOperations.tim_sort(self.sample_data, 'body_mass_g', reverse=True)
+        self.assertEqual([row['species'] for row in sorted_data], ['Gentoo', 'Adelie', 'Chinstrap', 'Adelie'])
+
+    def test_split_penguins_negative_mass(self):
+        """Test that splits are still found when some masses are negative"""
+        data = [{'body_mass_g': m} for m in ['3000', '2000', '-500', '-500']]
+        splits = DataOperations.split_penguins(data, 2500)
+        self.assertEqual([(len(g1), len(g2)) for g1, g2 in splits], [(2, 2), (2, 2)])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
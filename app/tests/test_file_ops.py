@@ -15,6 +15,7 @@ class TestFileOperations(unittest.TestCase):
 
     def tearDown(self):
         """Remove the temporary directory after tests"""
+        self.file_ops.close()
         shutil.rmtree(self.test_dir)
 
     def test_save_and_load_csv(self):
@@ -31,6 +32,80 @@ class TestFileOperations(unittest.TestCase):
         loaded_data = self.file_ops.load_csv(filename)
         self.assertEqual(loaded_data, self.sample_data)
 
+    def test_load_csv_reflects_saved_changes(self):
+        """Test that a cached file is re-read after it is overwritten"""
+        filename = "cached.csv"
+        self.file_ops.save_csv(filename, self.sample_data)
+        first = self.file_ops.load_csv(filename)
+        self.assertEqual(self.file_ops.load_csv(filename), first)
+        self.assertIsNot(self.file_ops.load_csv(filename), first)
+
+        new_data = [{'col1': 'new', 'col2': 'row'}]
+        self.file_ops.save_csv(filename, new_data)
+        self.assertEqual(self.file_ops.load_csv(filename), new_data)
+
+    def test_load_csv_normalizes_column_names(self):
+        """Test that raw column names are loaded in snake_case"""
+        with open(os.path.join(self.test_dir, "raw.csv"), 'w') as f:
+            f.write("Species,Body Mass (g),Individual ID\nAdelie,3750,N1A1\n")
+
+        loaded = self.file_ops.load_csv("raw.csv")
+        self.assertEqual(loaded, [{'species': 'Adelie', 'body_mass_g': '3750', 'individual_id': 'N1A1'}])
+
+    def test_load_csv_keeps_colliding_column_names(self):
+        """Test that columns which would share a normalized name keep their original names"""
+        with open(os.path.join(self.test_dir, "raw.csv"), 'w') as f:
+            f.write("Species,Body Mass (g),body_mass_g, ,\nAdelie,1,2,3,4\n")
+
+        loaded = self.file_ops.load_csv("raw.csv")
+        self.assertEqual(loaded, [{'species': 'Adelie', 'Body Mass (g)': '1', 'body_mass_g': '2', ' ': '3', '': '4'}])
+
+    def test_load_csv_ragged_rows(self):
+        """Test that rows longer or shorter than the header load like csv.DictReader"""
+        with open(os.path.join(self.test_dir, "ragged.csv"), 'w') as f:
+            f.write("a,b\n1,2,3\n4\n")
+
+        loaded = self.file_ops.load_csv("ragged.csv")
+        self.assertEqual(loaded, [{'a': '1', 'b': '2', None: ['3']}, {'a': '4', 'b': None}])
+
+    def test_has_normalized_header(self):
+        """Test detecting whether loading would rename any column"""
+        self.file_ops.save_csv("clean.csv", self.sample_data)
+        with open(os.path.join(self.test_dir, "raw.csv"), 'w') as f:
+            f.write("Species,Body Mass (g)\nAdelie,3750\n")
+
+        self.assertTrue(self.file_ops.has_normalized_header("clean.csv"))
+        self.assertFalse(self.file_ops.has_normalized_header("raw.csv"))
+
+    def test_log_sorting_appends_rows(self):
+        """Test that the sorting log gets one header and one row per sort"""
+        self.file_ops.log_sorting(10, 'Merge Sort', 0.5)
+        self.file_ops.log_sorting(20, 'Tim Sort', 0.25)
+
+        log = self.file_ops.load_csv('sorting_log.csv')
+        self.assertEqual([row['sorting_algorithm'] for row in log], ['Merge Sort', 'Tim Sort'])
+        self.assertEqual(log[1]['number_of_rows'], '20')
+        self.assertEqual(log[1]['execution_time_in_seconds'], '0.250000')
+
+    def test_close_reopens_sorting_log(self):
+        """Test that closing releases the sorting log and later sorts still append"""
+        self.file_ops.log_sorting(10, 'Merge Sort', 0.5)
+        log_file = self.file_ops._log_file
+        self.file_ops.close()
+        self.assertTrue(log_file.closed)
+
+        self.file_ops.log_sorting(20, 'Tim Sort', 0.25)
+        log = self.file_ops.load_csv('sorting_log.csv')
+        self.assertEqual([row['sorting_algorithm'] for row in log], ['Merge Sort', 'Tim Sort'])
+
+    def test_copy_csv(self):
+        """Test copying a saved file under a new name"""
+        self.file_ops.save_csv("source.csv", self.sample_data)
+        filename = self.file_ops.copy_csv("source.csv", "copy")
+
+        self.assertEqual(filename, "copy.csv")
+        self.assertEqual(self.file_ops.load_csv("copy.csv"), self.file_ops.load_csv("source.csv"))
+
     def test_list_csv_files(self):
         """Test listing CSV files in directory"""
         self.file_ops.save_csv("file1.csv", self.sample_data)
@@ -0,0 +1,68 @@
+import unittest
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+from app.ui.visualizer import Visualizer
+
+
+class TestVisualizer(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory and a small dataset to plot"""
+        self.test_dir = tempfile.mkdtemp()
+        self.sample_data = [
+            {'species': 'Adelie', 'body_mass_g': '3750', 'flipper_length_mm': '181'},
+            {'species': 'Gentoo', 'body_mass_g': '5000', 'flipper_length_mm': '210'},
+            {'species': 'Adelie', 'body_mass_g': '3200', 'flipper_length_mm': '190'},
+        ]
+
+    def tearDown(self):
+        """Remove the temporary directory after tests"""
+        shutil.rmtree(self.test_dir)
+
+    def _specs(self):
+        return [
+            ('create_histogram', ('body_mass_g', 3), os.path.join(self.test_dir, 'hist.png')),
+            ('create_scatter', ('body_mass_g', 'flipper_length_mm'), os.path.join(self.test_dir, 'scatter.png')),
+        ]
+
+    def test_histogram_skips_nan_values(self):
+        """Test that a 'nan' cell does not stop the histogram from being saved"""
+        filename = os.path.join(self.test_dir, 'hist.png')
+        data = self.sample_data + [{'species': 'Adelie', 'body_mass_g': 'nan', 'flipper_length_mm': '185'}]
+        Visualizer.create_histogram(data, 'body_mass_g', 3, filename)
+
+        self.assertTrue(os.path.isfile(filename))
+
+    def test_render_all_sequential(self):
+        """Test that every plot is saved when rendering in this process"""
+        with mock.patch('app.ui.visualizer.os.cpu_count', return_value=1):
+            Visualizer.render_all(self.sample_data, self._specs())
+
+        for _, _, filename in self._specs():
+            self.assertTrue(os.path.isfile(filename))
+
+    def test_render_all_parallel(self):
+        """Test that every plot is saved when rendering in worker processes"""
+        with mock.patch('app.ui.visualizer.os.cpu_count', return_value=4):
+            Visualizer.render_all(self.sample_data, self._specs())
+
+        for _, _, filename in self._specs():
+            self.assertTrue(os.path.isfile(filename))
+
+    def test_render_all_caps_workers_at_cpu_count(self):
+        """Test that no more worker processes are started than there are CPUs"""
+        specs = self._specs() + [('create_boxplot', ('species', 'body_mass_g'), os.path.join(self.test_dir, 'box.png'))]
+        with mock.patch('app.ui.visualizer.os.cpu_count', return_value=2), \
+                mock.patch('app.ui.visualizer.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as pool:
+            Visualizer.render_all(self.sample_data, specs)
+
+        pool.assert_called_once_with(max_workers=2)
+        for _, _, filename in specs:
+            self.assertTrue(os.path.isfile(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
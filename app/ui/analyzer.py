@@ -1,6 +1,5 @@
 from app.services.data_ops import DataOperations
 from app.services.file_ops import FileOperations
-from app.ui.visualizer import Visualizer
 from app.ui.commands import CommandHandler
 from app.ui import display
 
@@ -8,7 +7,8 @@ from app.ui import display
 class PenguinAnalyzer:
     def __init__(self, data_directory: str = "./data"):
         self.file_ops = FileOperations(data_directory)
-        self.visualizer = Visualizer()
+        # Created by the handler on the first plot command, so startup does not import matplotlib
+        self.visualizer = None
 
         # Determine sorting algorithm based on name
         self.sorting_algorithms = {
@@ -16,10 +16,12 @@ class PenguinAnalyzer:
             'insertion': ('Insertion Sort', DataOperations.insertion_sort),
             'selection': ('Selection Sort', DataOperations.selection_sort),
             'quick': ('Quick Sort', DataOperations.quick_sort),
-            'merge': ('Merge Sort', DataOperations.merge_sort)
+            'merge': ('Merge Sort', DataOperations.merge_sort),
+            'tim': ('Tim Sort', DataOperations.tim_sort)
         }
 
         self.handler = CommandHandler(self.file_ops, self.visualizer, self.sorting_algorithms)
+        self._dispatch = self._build_dispatch()
 
     def run(self):
         print("_-" * 66)
@@ -41,86 +43,85 @@ class PenguinAnalyzer:
             except Exception as e:
                 print(f"Error: {e}")
 
+    def _build_dispatch(self):
+        # Command -> (minimum number of words, callable taking the split words).
+        # Two-word commands are keyed by both words.
+        return {
+            'quit': (1, self._quit),
+            'help': (1, lambda parts: display.show_help_text()),
+            'print available_data': (2, lambda parts: self.handler.list_files()),
+            'load': (2, lambda parts: self.handler.load_file(parts[1])),
+            'filter': (3, lambda parts: self.handler.filter_data(parts[1], ' '.join(parts[2:]))),
+            'describe': (2, lambda parts: self.handler.describe_attribute(parts[1])),
+            'unique': (2, lambda parts: self.handler.unique_values(parts[1])),
+            'sort': (3, self._sort),
+            'augument': (3, self._augment),
+            'save_random': (3, self._save_random),
+            'generate research_groups': (3, self._generate_research_groups),
+            'split_into_groups': (2, self._split_into_groups),
+            'scatter': (3, lambda parts: self.handler.create_scatter(parts[1], parts[2])),
+            'hist': (3, self._histogram),
+            'boxplot': (3, lambda parts: self.handler.create_boxplot(parts[1], parts[2])),
+            'random_fact': (1, lambda parts: self.handler.random_fact()),
+            'draw_penguin': (1, lambda parts: self.handler.draw_penguin()),
+            'img_to_ascii': (1, lambda parts: self.handler.convert_image_to_ascii()),
+        }
+
     def process_command(self, command: str):
         parts = command.split()
         user_action = parts[0].lower()
 
-        if user_action == 'quit':
-            print("Goodbye!")
-            exit(0)
-
-        elif user_action == 'help':
-            display.show_help_text()
-
-        elif user_action == 'print' and len(parts) > 1 and parts[1] == 'available_data':
-            self.handler.list_files()
-
-        elif user_action == 'load' and len(parts) >= 2:
-            self.handler.load_file(parts[1])
-
-        elif user_action == 'filter' and len(parts) >= 3:
-            self.handler.filter_data(parts[1], ' '.join(parts[2:]))
-
-        elif user_action == 'describe' and len(parts) >= 2:
-            self.handler.describe_attribute(parts[1])
-
-        elif user_action == 'unique' and len(parts) >= 2:
-            self.handler.unique_values(parts[1])
-
-        elif user_action == 'sort' and len(parts) >= 3:
-            self.handler.sort_data(parts[1], parts[2])
-
-        elif user_action == 'augument' and len(parts) >= 3:
-            try:
-                percent = int(parts[1])
-                method = parts[2]
-                self.handler.augment_data(percent, method)
-            except ValueError:
-                print("Error: Percent must be a number.")
-
-        elif user_action == 'save_random' and len(parts) >= 3:
-            try:
-                k = int(parts[1])
-                filename = parts[2]
-                self.handler.save_random(k, filename)
-            except ValueError:
-                print("Error: k must be an integer.")
-
-        elif user_action == 'generate' and len(parts) >= 3 and parts[1] == 'research_groups':
-            try:
-                k = int(parts[2])
-                self.handler.generate_research_groups(k)
-            except ValueError:
-                print("Error: k must be an integer.")
-
-        elif user_action == 'split_into_groups' and len(parts) >= 2:
-            try:
-                threshold = float(parts[1])
-                self.handler.split_into_groups(threshold)
-            except ValueError:
-                print("Error: threshold must be a number.")
-
-        elif user_action == 'scatter' and len(parts) >= 3:
-            self.handler.create_scatter(parts[1], parts[2])
-
-        elif user_action == 'hist' and len(parts) >= 3:
-            try:
-                bins = int(parts[2])
-                self.handler.create_histogram(parts[1], bins)
-            except ValueError:
-                print("Error: Bins must be a number.")
-
-        elif user_action == 'boxplot' and len(parts) >= 3:
-            self.handler.create_boxplot(parts[1], parts[2])
-
-        elif user_action == 'random_fact':
-            self.handler.random_fact()
-
-        elif user_action == 'draw_penguin':
-            self.handler.draw_penguin()
-
-        elif user_action == 'img_to_ascii':
-            self.handler.convert_image_to_ascii()
-
-        else:
-            print("Unknown command. Type 'help' for available commands.")
\ No newline at end of file
+        entry = self._dispatch.get(user_action)
+        if entry is None and len(parts) > 1:
+            entry = self._dispatch.get(f"{user_action} {parts[1]}")
+
+        if entry is None or len(parts) < entry[0]:
+            print("Unknown command. Type 'help' for available commands.")
+            return
+
+        entry[1](parts)
+
+    def _quit(self, parts):
+        print("Goodbye!")
+        exit(0)
+
+    def _sort(self, parts):
+        algorithm = parts[3].lower() if len(parts) >= 4 else None
+        self.handler.sort_data(parts[1], parts[2], algorithm)
+
+    def _augment(self, parts):
+        try:
+            percent = int(parts[1])
+            method = parts[2]
+            self.handler.augment_data(percent, method)
+        except ValueError:
+            print("Error: Percent must be a number.")
+
+    def _save_random(self, parts):
+        try:
+            k = int(parts[1])
+            filename = parts[2]
+            self.handler.save_random(k, filename)
+        except ValueError:
+            print("Error: k must be an integer.")
+
+    def _generate_research_groups(self, parts):
+        try:
+            k = int(parts[2])
+            self.handler.generate_research_groups(k)
+        except ValueError:
+            print("Error: k must be an integer.")
+
+    def _split_into_groups(self, parts):
+        try:
+            threshold = float(parts[1])
+            self.handler.split_into_groups(threshold)
+        except ValueError:
+            print("Error: threshold must be a number.")
+
+    def _histogram(self, parts):
+        try:
+            bins = int(parts[2])
+            self.handler.create_histogram(parts[1], bins)
+        except ValueError:
+            print("Error: Bins must be a number.")
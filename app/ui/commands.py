@@ -4,7 +4,7 @@ from app.exceptions import (
     PenguinDataException, FileNotLoadedException, InvalidSortOrderException
 )
 from app.services.data_ops import DataOperations
-from app.ui import display, fun, image_to_ascii
+from app.ui import display, fun
 
 
 class CommandHandler:
@@ -15,11 +15,13 @@ class CommandHandler:
 
     def __init__(self, file_ops, visualizer, sorting_algorithms):
         self.file_ops = file_ops
+        # May be None: the Visualizer (and matplotlib) is then only imported by the first plot command
         self.visualizer = visualizer
         self.sorting_algorithms = sorting_algorithms
         self.current_data = []
+        self.current_columns = None
         self.current_filename = None
-        self.default_sort = 'merge'
+        self.default_sort = 'tim'
         self.image_path = "900.jpeg"
 
     def list_files(self):
@@ -49,7 +51,8 @@ class CommandHandler:
                 filename = clean_filename
 
         try:
-            self.current_data = self.file_ops.load_csv(filename)
+            self.current_columns = self.file_ops.load_csv_columns(filename)
+            self.current_data = list(self.current_columns.rows)
             self.current_filename = filename
             print(f"Loaded {len(self.current_data)} rows.")
         except FileNotFoundError as e:
@@ -66,15 +69,19 @@ class CommandHandler:
             value (str): The value to match.
         """
         try:
-            filtered = DataOperations.filter_data(self.current_data, attribute, value)
+            filtered = DataOperations.filter_data(
+                self.current_data, attribute, value, columns=self.current_columns
+            )
             print(f"Matches found: {len(filtered)}.")
 
             response = input("Do you want to save this data to a new file? (y/n) ").strip().lower()
             if response in ['y', 'yes']:
                 filename = input("Please give the filename: ").strip()
-                if not filename.endswith('.csv'):
-                    filename += '.csv'
-                self.file_ops.save_csv(filename, filtered)
+                if self._is_unchanged_file(filtered):
+                    # Nothing was filtered out, so the loaded file can be copied as it is
+                    filename = self.file_ops.copy_csv(self.current_filename, filename)
+                else:
+                    filename = self.file_ops.save_csv(filename, filtered)
                 print(f"Saved to: {filename}")
             else:
                 display.display_data_rows(filtered)
@@ -82,6 +89,19 @@ class CommandHandler:
         except PenguinDataException as e:
             print(f"Error: {e}")
 
+    def _is_unchanged_file(self, rows) -> bool:
+        """
+        Checks whether rows are exactly the loaded file, which must still be unchanged on disk
+        and already use normalized column names (otherwise a copy would keep the raw header).
+        """
+        if self.current_columns is None or len(rows) != len(self.current_columns.rows):
+            return False
+        try:
+            return (self.file_ops.load_csv_columns(self.current_filename) is self.current_columns
+                    and self.file_ops.has_normalized_header(self.current_filename))
+        except FileNotFoundError:
+            return False
+
     def describe_attribute(self, attribute: str):
         """
         Prints descriptive statistics for a numeric attribute.
@@ -91,7 +111,7 @@ class CommandHandler:
         """
         try:
             min_val, max_val, mean_val = DataOperations.describe_attribute(
-                self.current_data, attribute
+                self.current_data, attribute, columns=self.current_columns
             )
             print(f"{attribute}: min = {min_val:.1f} max = {max_val:.1f} mean = {mean_val:.1f}")
         except PenguinDataException as e:
@@ -105,19 +125,22 @@ class CommandHandler:
             attribute (str): The attribute to analyze.
         """
         try:
-            counts = DataOperations.unique_values(self.current_data, attribute)
+            counts = DataOperations.unique_values(
+                self.current_data, attribute, columns=self.current_columns
+            )
             for value, count in sorted(counts.items()):
                 print(f"{value}: {count} penguins")
         except PenguinDataException as e:
             print(f"Error: {e}")
 
-    def sort_data(self, attribute: str, order: str):
+    def sort_data(self, attribute: str, order: str, algorithm: str = None):
         """
         Sorts the data and displays the result.
 
         Args:
             attribute (str): The column to sort by.
             order (str): 'asc' for ascending, 'desc' for descending.
+            algorithm (str, optional): Key of the sorting algorithm to use. Defaults to self.default_sort.
         """
         try:
             if not self.current_data:
@@ -126,10 +149,16 @@ class CommandHandler:
             if order not in ['asc', 'desc']:
                 raise InvalidSortOrderException("Sort order must be 'asc' or 'desc'")
 
-            algo_name, algo_func = self.sorting_algorithms[self.default_sort]
+            algorithm = algorithm or self.default_sort
+            if algorithm not in self.sorting_algorithms:
+                raise PenguinDataException(
+                    f"Unknown sorting algorithm '{algorithm}'. "
+                    f"Choose from: {', '.join(self.sorting_algorithms)}"
+                )
+            algo_name, algo_func = self.sorting_algorithms[algorithm]
 
             start_time = time.time()
-            sorted_data = algo_func(self.current_data, attribute, order == 'desc')
+            sorted_data = algo_func(self.current_data, attribute, order == 'desc', columns=self.current_columns)
             execution_time = time.time() - start_time
 
             self.file_ops.log_sorting(len(self.current_data), algo_name, execution_time)
@@ -173,10 +202,7 @@ class CommandHandler:
         try:
             subset = DataOperations.get_random_subset(self.current_data, k)
 
-            if not filename.endswith('.csv'):
-                filename += '.csv'
-
-            self.file_ops.save_csv(filename, subset)
+            filename = self.file_ops.save_csv(filename, subset)
             print(f"Successfully saved {k} random penguins to {filename}.")
         except PenguinDataException as e:
             print(f"Error: {e}")
@@ -202,9 +228,9 @@ class CommandHandler:
                 print(f"Group {i}:")
                 for p in group:
                     # Print simplified info: species and ID if available, or just index
-                    info = f"{p.get('species') or p.get('Species')}"
-                    if 'Individual ID' in p:
-                        info += f" (ID: {p['Individual ID']})"
+                    info = f"{p.get('species')}"
+                    if 'individual_id' in p:
+                        info += f" (ID: {p['individual_id']})"
                     print(f"  - {info}")
                 print("-" * 20)
 
@@ -225,10 +251,13 @@ class CommandHandler:
                 print(f"Error: No valid splits found where both groups have mass <= {threshold}.")
                 return
 
+            # Parse each penguin's mass once; every split refers to the same row dictionaries
+            masses = {id(p): DataOperations.body_mass(p) for p in self.current_data}
+
             print(f"\nFound {len(splits)} valid ways to split the penguins:\n")
             for i, (g1, g2) in enumerate(splits, 1):
-                mass1 = sum(float(p.get('body_mass_g', p.get('Body Mass (g)', 0))) for p in g1)
-                mass2 = sum(float(p.get('body_mass_g', p.get('Body Mass (g)', 0))) for p in g2)
+                mass1 = sum(masses[id(p)] for p in g1)
+                mass2 = sum(masses[id(p)] for p in g2)
 
                 print(f"Split {i}:")
                 print(f"  Group A: {len(g1)} penguins, Total Mass: {mass1:.1f}")
@@ -250,7 +279,9 @@ class CommandHandler:
             filename = f"scatter_{attr1}_{attr2}_{timestamp}.png"
             filepath = os.path.join(self.file_ops.data_directory, filename)
 
-            self.visualizer.create_scatter(self.current_data, attr1, attr2, filepath)
+            self._get_visualizer().create_scatter(
+                self.current_data, attr1, attr2, filepath, columns=self.current_columns
+            )
 
         except PenguinDataException as e:
             print(f"Error: {e}")
@@ -265,7 +296,9 @@ class CommandHandler:
             filename = f"hist_{attribute}_{bins}bins_{timestamp}.png"
             filepath = os.path.join(self.file_ops.data_directory, filename)
 
-            self.visualizer.create_histogram(self.current_data, attribute, bins, filepath)
+            self._get_visualizer().create_histogram(
+                self.current_data, attribute, bins, filepath, columns=self.current_columns
+            )
 
         except PenguinDataException as e:
             print(f"Error: {e}")
@@ -280,11 +313,20 @@ class CommandHandler:
             filename = f"boxplot_{group_by}_{attribute}_{timestamp}.png"
             filepath = os.path.join(self.file_ops.data_directory, filename)
 
-            self.visualizer.create_boxplot(self.current_data, group_by, attribute, filepath)
+            self._get_visualizer().create_boxplot(
+                self.current_data, group_by, attribute, filepath, columns=self.current_columns
+            )
 
         except PenguinDataException as e:
             print(f"Error: {e}")
 
+    def _get_visualizer(self):
+        """Returns the visualizer, creating it on first use."""
+        if self.visualizer is None:
+            from app.ui.visualizer import Visualizer
+            self.visualizer = Visualizer()
+        return self.visualizer
+
     def random_fact(self):
         """Displays a random penguin fact."""
         print(f"\n Penguin Fact: {fun.get_random_fact()}\n")
@@ -295,5 +337,7 @@ class CommandHandler:
 
     def convert_image_to_ascii(self):
         """Converts an image to ASCII art."""
+        # Imported here so PIL is only loaded when this command is used
+        from app.ui import image_to_ascii
         converter = image_to_ascii.ImageToASCII(self.image_path)
         converter.generate_ascii()
\ No newline at end of file
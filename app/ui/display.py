@@ -1,3 +1,4 @@
+import sys
 from typing import List, Dict
 
 def show_help_text():
@@ -9,7 +10,8 @@ def show_help_text():
     filter <attribute> <value>        - Filter data based on attribute and value
     describe <attribute>              - Show min, max, mean for numeric attribute
     unique <attribute>                - Show unique values and their counts
-    sort <attribute> <asc|desc>       - Sort data by attribute
+    sort <attr> <asc|desc> [algo]     - Sort data by attribute (algo: tim, merge, quick,
+                                        insertion, selection or bubble; default tim)
     augument <percent> <method>       - Augment data (method: duplicate or create)
     save_random <k> <filename>        - Save k random penguins to a new CSV file
     generate research_groups <k>      - Generate groups of size k with all species (max 10 loaded)
@@ -29,13 +31,15 @@ def display_data_rows(data: List[Dict], max_rows: int = 20):
         print("No data to display.")
         return
 
-    print(f"\nDisplaying first {min(len(data), max_rows)} of {len(data)} rows:\n")
+    # The whole listing is built first and written in one call instead of one print per field
+    parts = [f"\nDisplaying first {min(len(data), max_rows)} of {len(data)} rows:\n\n"]
 
     for i, row in enumerate(data[:max_rows]):
-        print(f"Penguin {i+1}:")
-        for key, value in row.items():
-            print(f"  {key}: {value}")
-        print()
+        parts.append(f"Penguin {i+1}:\n")
+        parts.extend(f"  {key}: {value}\n" for key, value in row.items())
+        parts.append("\n")
 
     if len(data) > max_rows:
-        print(f"... and {len(data) - max_rows} more rows")
\ No newline at end of file
+        parts.append(f"... and {len(data) - max_rows} more rows\n")
+
+    sys.stdout.write("".join(parts))
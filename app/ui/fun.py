@@ -1,18 +1,13 @@
 import random
 
+_FACTS = (
+    "Penguins are flightless birds that have adapted to life in the water.",
+    "Emperor penguins can dive to depths of over 500 meters.",
+    "Penguins spend up to 75% of their lives in the water.",
+    "There are 18 species of penguins in the world."
+)
 
-def get_random_fact() -> str:
-    facts = [
-        "Penguins are flightless birds that have adapted to life in the water.",
-        "Emperor penguins can dive to depths of over 500 meters.",
-        "Penguins spend up to 75% of their lives in the water.",
-        "There are 18 species of penguins in the world."
-    ]
-    return random.choice(facts)
-
-
-def draw_ascii_penguin():
-    penguin = """
+_PENGUIN = """
 
                _~_    
               (o o)   
@@ -22,4 +17,11 @@ def draw_ascii_penguin():
 
          Hello from Antarctica! 
     """
-    print(penguin)
\ No newline at end of file
+
+
+def get_random_fact() -> str:
+    return random.choice(_FACTS)
+
+
+def draw_ascii_penguin():
+    print(_PENGUIN)
\ No newline at end of file
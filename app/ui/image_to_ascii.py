@@ -1,9 +1,23 @@
 from PIL import Image
+from functools import lru_cache
+import os
 import sys
 import shutil
 
-# ASCII_CHARS = ['@', '#', 'S', '%', '?', '*', '+', ';', ':', ',', '.']
-ASCII_CHARS = ['.', ',', ':', ';', '+', '*', '?', '%', 'S', '#', '@']
+# ASCII_CHARS = b'@#S%?*+;:,.'
+ASCII_CHARS = b'.,:;+*?%S#@'
+
+# Character byte for each of the 256 grayscale intensities (every 25 levels map to the next character)
+_INTENSITY_TO_CHAR = bytes(ASCII_CHARS[min(i // 25, len(ASCII_CHARS) - 1)] for i in range(256))
+
+
+@lru_cache(maxsize=4)
+def _load_image(image_path, mtime_ns):
+    # Decoded once per file version (the modification time is part of the key), then reused.
+    # Callers must not modify the returned image.
+    with Image.open(image_path) as image:
+        image.load()
+    return image
 
 
 class ImageToASCII:
@@ -13,34 +27,32 @@ class ImageToASCII:
         self.aspect_ratio_factor = 0.55  # Adjust based on font aspect ratio
 
     def pixel_to_ascii(self, image):
-        pixels = image.getdata()
-        ascii_str = "".join(ASCII_CHARS[min(pixel // 25, len(ASCII_CHARS) - 1)] for pixel in pixels)
-        return ascii_str
+        # One byte per grayscale pixel, translated to its character by a table lookup in C
+        return image.tobytes().translate(_INTENSITY_TO_CHAR).decode('ascii')
 
     def resize_image(self, image):
         width, height = image.size
         aspect_ratio = height / width
         new_height = int(aspect_ratio * self.width * self.aspect_ratio_factor)
-        return image.resize((self.width, new_height))
+        return image.resize((self.width, new_height), Image.Resampling.BILINEAR)
 
     def grayscale_image(self, image):
         return image.convert("L")
 
     def generate_ascii(self):
         try:
-            image = Image.open(self.image_path)
+            image = _load_image(self.image_path, os.stat(self.image_path).st_mtime_ns)
         except Exception as e:
             print(f"Unable to open image file {self.image_path}. {e}")
             return
 
-        image = self.resize_image(image)
-        grayscale_img = self.grayscale_image(image)
+        # Converting first means the resampler works on one channel instead of three
+        grayscale_img = self.resize_image(self.grayscale_image(image))
         ascii_str = self.pixel_to_ascii(grayscale_img)
 
+        # Written line by line rather than joined into a second full-size copy of the picture
         img_width = grayscale_img.width
-        ascii_img = "\n".join(ascii_str[i:(i + img_width)] for i in range(0, len(ascii_str), img_width))
-
-        print(ascii_img)
+        sys.stdout.writelines(f"{ascii_str[i:(i + img_width)]}\n" for i in range(0, len(ascii_str), img_width))
         print("Printed ASCII image")
 
 
@@ -1,90 +1,161 @@
-import matplotlib.pyplot as plt
-from typing import List, Dict
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from typing import List, Dict, Optional, Sequence, Tuple
 from app.exceptions import NonNumericAttributeException
+from app.services.columns import ColumnStore
 from app.services.data_ops import DataOperations
 
 class Visualizer:
+    # From this many points a scatter plot is drawn as a single marker line, which renders
+    # about twice as fast as a per-point collection and is rasterized in vector output
+    FAST_SCATTER_MIN_POINTS = 5000
+
     @staticmethod
-    def create_scatter(data: List[Dict], attr1: str, attr2: str, filename: str = None) -> None:
+    def create_scatter(data: List[Dict], attr1: str, attr2: str, filename: str = None,
+                       columns: Optional[ColumnStore] = None) -> None:
         if attr1 not in DataOperations.NUMERIC_COLUMNS or attr2 not in DataOperations.NUMERIC_COLUMNS:
             raise NonNumericAttributeException("Both attributes must be numeric for scatter plot.")
+        if columns is None:
+            columns = ColumnStore(data)
 
-        x_vals = []
-        y_vals = []
-
-        for row in data:
-            try:
-                x_vals.append(float(row[attr1]))
-                y_vals.append(float(row[attr2]))
-            except (ValueError, KeyError):
-                continue
+        # Only rows with a valid number in both columns are plotted
+        x_vals = Visualizer._column_by_row(columns, attr1)
+        y_vals = Visualizer._column_by_row(columns, attr2)
+        valid = ~(np.isnan(x_vals) | np.isnan(y_vals))
+        if not valid.all():
+            # Boolean indexing copies, so it is only done when some rows have to be dropped
+            x_vals = x_vals[valid]
+            y_vals = y_vals[valid]
 
-        plt.figure(figsize=(10, 6))
-        plt.scatter(x_vals, y_vals, alpha=0.6)
-        plt.xlabel(attr1.replace('_', ' ').title())
-        plt.ylabel(attr2.replace('_', ' ').title())
-        plt.title(f'{attr1} vs {attr2}')
-        plt.grid(True, alpha=0.3)
-
-        if filename:
-            plt.savefig(filename)
-            print(f"Scatter plot saved to {filename}")
+        fig = Visualizer._new_figure(filename)
+        ax = fig.subplots()
+        if len(x_vals) >= Visualizer.FAST_SCATTER_MIN_POINTS:
+            ax.plot(x_vals, y_vals, '.', alpha=0.6, markersize=3, rasterized=True)
         else:
-            plt.show()
-        plt.close()
+            ax.scatter(x_vals, y_vals, alpha=0.6)
+        ax.set_xlabel(attr1.replace('_', ' ').title())
+        ax.set_ylabel(attr2.replace('_', ' ').title())
+        ax.set_title(f'{attr1} vs {attr2}')
+        ax.grid(True, alpha=0.3)
+
+        Visualizer._finish(fig, filename, "Scatter plot")
 
     @staticmethod
-    def create_histogram(data: List[Dict], attribute: str, bins: int, filename: str = None) -> None:
+    def create_histogram(data: List[Dict], attribute: str, bins: int, filename: str = None,
+                         columns: Optional[ColumnStore] = None) -> None:
         if attribute not in DataOperations.NUMERIC_COLUMNS:
             raise NonNumericAttributeException(f"The attribute '{attribute}' is not numeric.")
+        if columns is None:
+            columns = ColumnStore(data)
 
-        values = []
-        for row in data:
-            try:
-                values.append(float(row[attribute]))
-            except (ValueError, KeyError):
-                continue
+        # Zero-copy view of the parsed column
+        values = np.frombuffer(columns.numeric(attribute)[0], dtype=np.float64)
+        # 'nan' and 'inf' cells parse as floats but cannot be binned; hist() left them out as well
+        finite = np.isfinite(values)
+        if not finite.all():
+            values = values[finite]
 
-        plt.figure(figsize=(10, 6))
-        plt.hist(values, bins=bins, edgecolor='black', alpha=0.7)
-        plt.xlabel(attribute.replace('_', ' ').title())
-        plt.ylabel('Frequency')
-        plt.title(f'Distribution of {attribute}')
-        plt.grid(True, alpha=0.3, axis='y')
+        # Bin in numpy and draw the bars directly, skipping hist()'s input validation and re-binning
+        counts, edges = np.histogram(values, bins=bins)
 
-        if filename:
-            plt.savefig(filename)
-            print(f"Histogram saved to {filename}")
-        else:
-            plt.show()
-        plt.close()
+        fig = Visualizer._new_figure(filename)
+        ax = fig.subplots()
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='black', alpha=0.7)
+        ax.set_xlabel(attribute.replace('_', ' ').title())
+        ax.set_ylabel('Frequency')
+        ax.set_title(f'Distribution of {attribute}')
+        ax.grid(True, alpha=0.3, axis='y')
+
+        Visualizer._finish(fig, filename, "Histogram")
 
     @staticmethod
-    def create_boxplot(data: List[Dict], group_by: str, attribute: str, filename: str = None) -> None:
+    def create_boxplot(data: List[Dict], group_by: str, attribute: str, filename: str = None,
+                       columns: Optional[ColumnStore] = None) -> None:
         if attribute not in DataOperations.NUMERIC_COLUMNS:
             raise NonNumericAttributeException(f"The attribute '{attribute}' is not numeric.")
+        if columns is None:
+            columns = ColumnStore(data)
 
-        groups = {}
-        for row in data:
-            group = row.get(group_by)
-            if group:
-                if group not in groups:
-                    groups[group] = []
-                try:
-                    groups[group].append(float(row[attribute]))
-                except (ValueError, KeyError):
-                    continue
-
-        plt.figure(figsize=(10, 6))
-        plt.boxplot(groups.values(), labels=groups.keys())
-        plt.xlabel(group_by.title())
-        plt.ylabel(attribute.replace('_', ' ').title())
-        plt.title(f'{attribute} by {group_by}')
-        plt.grid(True, alpha=0.3, axis='y')
+        # One box per group, in order of first appearance. The values with a group are
+        # ordered by group code (stable, so row order is kept) and cut at the group sizes.
+        names, codes = columns.categories(group_by)
+        values, indices = columns.numeric(attribute)
+        codes = np.frombuffer(codes, dtype=np.int64)[np.frombuffer(indices, dtype=np.int64)]
+        values = np.frombuffer(values, dtype=np.float64)
+        grouped = codes >= 0
+        codes = codes[grouped]
+        order = np.argsort(codes, kind='stable')
+        sizes = np.bincount(codes, minlength=len(names))
+        groups = dict(zip(names, np.split(values[grouped][order], np.cumsum(sizes)[:-1])))
 
+        fig = Visualizer._new_figure(filename)
+        ax = fig.subplots()
+        ax.boxplot(list(groups.values()))
+        ax.set_xticklabels(list(groups.keys()))
+        ax.set_xlabel(group_by.title())
+        ax.set_ylabel(attribute.replace('_', ' ').title())
+        ax.set_title(f'{attribute} by {group_by}')
+        ax.grid(True, alpha=0.3, axis='y')
+
+        Visualizer._finish(fig, filename, "Boxplot")
+
+    @staticmethod
+    def render_all(data: List[Dict], specs: Sequence[Tuple[str, tuple, str]]) -> None:
+        """Saves several plots, rendering them in parallel worker processes when possible.
+
+        Each spec is (method name, arguments after data, filename), for example
+        ('create_histogram', ('body_mass_g', 10), 'hist.png'). Plots are independent
+        and CPU bound in Agg, so with more than one CPU they are spread over up to one
+        process per CPU.
+        """
+        workers = min(len(specs), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_plot, data, *spec) for spec in specs]
+                for future in futures:
+                    future.result()
+        else:
+            for spec in specs:
+                _render_plot(data, *spec)
+
+    @staticmethod
+    def _new_figure(filename: Optional[str]) -> Figure:
+        """Creates the figure for a plot.
+
+        Plots saved to a file use a standalone Figure, which renders with Agg and never
+        starts pyplot's GUI backend; only plots shown on screen go through pyplot.
+        """
+        if filename:
+            return Figure(figsize=(10, 6))
+        # pyplot (and with it a GUI backend) is only imported when a plot is shown on screen
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=(10, 6))
+
+    @staticmethod
+    def _finish(fig: Figure, filename: Optional[str], description: str) -> None:
+        """Saves the figure to filename, or shows it when no filename is given."""
         if filename:
-            plt.savefig(filename)
-            print(f"Boxplot saved to {filename}")
+            fig.savefig(filename)
+            print(f"{description} saved to {filename}")
         else:
+            import matplotlib.pyplot as plt
             plt.show()
-        plt.close()
\ No newline at end of file
+            plt.close(fig)
+
+    @staticmethod
+    def _column_by_row(columns: ColumnStore, attribute: str) -> np.ndarray:
+        """Returns a numeric column with one entry per row, NaN where the value is missing or invalid."""
+        values, indices = columns.numeric(attribute)
+        if len(values) == len(columns.rows):
+            # Every row parsed: share the cached buffer instead of copying it
+            return np.frombuffer(values, dtype=np.float64)
+        result = np.full(len(columns.rows), np.nan)
+        result[np.frombuffer(indices, dtype=np.int64)] = np.frombuffer(values, dtype=np.float64)
+        return result
+
+
+def _render_plot(data: List[Dict], method: str, args: tuple, filename: str) -> None:
+    # Module level so it can be sent to worker processes
+    getattr(Visualizer, method)(data, *args, filename)
@@ -12,15 +12,14 @@ if __name__ == "__main__":
 
     # Ensure data directory exists
     data_dir = "./data"
-    if not os.path.exists(data_dir):
-        os.makedirs(data_dir)
+    os.makedirs(data_dir, exist_ok=True)
 
     # Check if we need to preprocess data
     # Logic: If raw exists but clean doesn't, or if clean is missing
-    raw_path = os.path.join(data_dir, 'penguins.csv')
-    clean_path = os.path.join(data_dir, 'penguins_data.csv')
+    # (the directory is listed once instead of checking each path separately)
+    data_files = set(os.listdir(data_dir))
 
-    if os.path.exists(raw_path) and not os.path.exists(clean_path):
+    if 'penguins.csv' in data_files and 'penguins_data.csv' not in data_files:
         print("Preprocessing data...")
         analyze_missing_data(data_dir=data_dir)
         preprocess_penguins_data(data_dir=data_dir)